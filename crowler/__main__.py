@@ -1,7 +1,4 @@
 import argparse
-from IPython import embed
-
-from crowler.driver import AvailableBrowserDrivers
 
 parser = argparse.ArgumentParser(
     prog = 'Crowler',
@@ -13,6 +10,9 @@ parser.add_argument("-b", "--browser", default="chrome")
 
 args = parser.parse_args()
 
+# Imported after argument parsing so --help and argument errors do not pay for loading selenium and IPython
+from crowler.driver import AvailableBrowserDrivers
+
 browser_name = args.browser
 
 if browser_name not in AvailableBrowserDrivers:
@@ -21,4 +21,6 @@ if browser_name not in AvailableBrowserDrivers:
 
 driver = AvailableBrowserDrivers[browser_name]()
 
+from IPython import embed
+
 embed()
@@ -1,6 +1,10 @@
 import logging
 import os
 
+# Set once setup() has run, logging only needs to be configured once per process
+_configured = False
+
+
 # Re-configure webdriver_manager logging
 def _disable_webdriver_manager_logging():
     logging.getLogger('WDM').setLevel(logging.NOTSET)
@@ -8,6 +12,10 @@ def _disable_webdriver_manager_logging():
 
 def setup():
     """
-    Sets up all logging functionality.
+    Sets up all logging functionality. Calling it again after the first call does nothing.
     """
+    global _configured
+    if _configured:
+        return
     _disable_webdriver_manager_logging()
+    _configured = True
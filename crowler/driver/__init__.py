@@ -1,11 +1,14 @@
+from types import MappingProxyType
 
-from crowler.driver.chrome import ChromeDriver
 from crowler.core import logging
 
-# Setup logging at driver import time
+# Setup logging at driver import time, before driver modules are imported since they start resolving drivers
 logging.setup()
 
+from crowler.driver.chrome import ChromeDriver
+
 # This should get imported for checking currently available driver classes and initializing them.
-AvailableBrowserDrivers = {
+# Read-only so the registry can not diverge between modules that import it.
+AvailableBrowserDrivers = MappingProxyType({
     "chrome": ChromeDriver
-}
+})
@@ -4,17 +4,141 @@ Module containing _BaseDriver used as parent in other drivers for extending func
 
 from __future__ import annotations
 from typing import Callable
+import functools
+import time
 
+from selenium.common.exceptions import (
+    JavascriptException,
+    NoSuchElementException,
+    StaleElementReferenceException,
+    TimeoutException,
+)
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.remote import webelement
 from selenium.webdriver.remote.webelement import WebElement
 
+# First poll interval of waits, doubled after every poll up to the WebDriverWait poll frequency
+_MIN_POLL_FREQUENCY = 0.05
+
+# Seconds a located element is reused by methods called with cache=True
+_ELEMENT_CACHE_TTL = 0.5
+
+# Scripts for reading element attributes in a single WebDriver call, the element is passed as arguments[0]
+_ALL_ATTRIBUTES_SCRIPT = (
+    "var a = {}, attrs = arguments[0].attributes;"
+    "for (var i = 0; i < attrs.length; i++) { a[attrs[i].name] = attrs[i].value; }"
+    "return a;"
+)
+# Reads the arguments[1] attributes with Selenium's getAttribute atom, run through _with_selenium_atoms
+_MANY_ATTRIBUTES_SCRIPT = """
+var a = {}, names = arguments[1];
+for (var i = 0; i < names.length; i++) { a[names[i]] = getAttribute(arguments[0], names[i]); }
+return a;
+"""
+# Returns the first element matching each CSS selector in arguments[0], null for selectors without a match
+_BULK_QUERY_SCRIPT = "return arguments[0].map(function (s) { return document.querySelector(s); });"
+# Waits until an element matching the CSS selector in arguments[0] is added to the DOM, using a MutationObserver.
+# Calls back with the element, or with null once arguments[1] seconds have passed
+_PRESENCE_OBSERVER_SCRIPT = """
+var selector = arguments[0], done = arguments[arguments.length - 1];
+var element = document.querySelector(selector);
+if (element) { return done(element); }
+var observer = new MutationObserver(function () {
+    var found = document.querySelector(selector);
+    if (found) { observer.disconnect(); clearTimeout(timer); done(found); }
+});
+var timer = setTimeout(function () { observer.disconnect(); done(null); }, arguments[1] * 1000);
+observer.observe(document.documentElement, {childList: true, subtree: true});
+"""
+# Waits until the element matching the CSS selector in arguments[0] is displayed and reads its arguments[1] attribute,
+# with the same atoms WebElement.is_displayed and get_attribute use. Calls back with {value: ...}, or with null once
+# arguments[2] seconds have passed. Run through _with_selenium_atoms
+_VISIBLE_ATTRIBUTE_SCRIPT = """
+var selector = arguments[0], name = arguments[1], done = arguments[arguments.length - 1];
+var deadline = Date.now() + arguments[2] * 1000;
+function read() {
+    var el = document.querySelector(selector);
+    if (!el || !isDisplayed(el)) { return false; }
+    done({value: getAttribute(el, name)});
+    return true;
+}
+if (read()) { return; }
+var timer = setInterval(function () {
+    if (read()) { clearInterval(timer); }
+    else if (Date.now() > deadline) { clearInterval(timer); done(null); }
+}, 50);
+"""
+# Clicks the element given by the CSS selector in arguments[0] if it is visible and enabled, returns the element or null
+_FAST_CLICK_SCRIPT = (
+    "var el = document.querySelector(arguments[0]);"
+    "if (!el || el.disabled || !el.getClientRects().length || getComputedStyle(el).visibility === 'hidden') {"
+    "    return null;"
+    "}"
+    "el.click();"
+    "return el;"
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _with_selenium_atoms(script: str) -> str:
+    """
+    Function prepends Selenium's getAttribute and isDisplayed atoms, the scripts WebElement.get_attribute and
+    WebElement.is_displayed run, to the script as the getAttribute(element, name) and isDisplayed(element) functions.
+    """
+    if webelement.getAttribute_js is None or webelement.isDisplayed_js is None:
+        webelement._load_js()
+    return (
+        f"var getAttribute = {webelement.getAttribute_js};\n"
+        f"var isDisplayed = {webelement.isDisplayed_js};\n"
+        f"{script}"
+    )
+
+
+@functools.lru_cache(maxsize=4096)
+def _make_condition(waiting_function: Callable, by: By, selector: str) -> Callable:
+    """
+    Function creates the expected condition for the locator, conditions hold no state so they are reused across waits.
+    """
+    return waiting_function((by, selector))
+
+
+class _AdaptiveWait(WebDriverWait):
+    """
+    WebDriverWait that starts polling at _MIN_POLL_FREQUENCY and doubles the interval after every poll until it reaches
+    the poll frequency, so elements that appear shortly after the wait starts are returned sooner.
+    """
+    def until(self, method: Callable, message: str = ""):
+        screen = None
+        stacktrace = None
+        poll = min(_MIN_POLL_FREQUENCY, self._poll)
+
+        end_time = time.monotonic() + self._timeout
+        while True:
+            try:
+                value = method(self._driver)
+                if value:
+                    return value
+            except self._ignored_exceptions as exc:
+                screen = getattr(exc, "screen", None)
+                stacktrace = getattr(exc, "stacktrace", None)
+            time.sleep(poll)
+            poll = min(poll * 2, self._poll)
+            if time.monotonic() > end_time:
+                break
+        raise TimeoutException(message, screen, stacktrace)
+
 
 class _BaseDriver:
     """
     Base class for all drivers holding methods that slightly extend and simplify the functionality of the driver object.
     """
+    def __init__(self, *args, **kwargs) -> None:
+        # Recently located visible elements, keyed by (by, selector), holding (time located, element)
+        self._elem_cache = {}
+        super().__init__(*args, **kwargs)
+
     def __wait_executor(
         self,
         implicit_wait_time: float,
@@ -26,6 +150,7 @@ class _BaseDriver:
         """
         Method executes the WebDriverWait function on self object, waiting the specified implicit time until the
         waiting_function call returns True. Method fetches element at the end, if element is fetched.
+        The condition is checked once directly first, a WebDriverWait is only created if the element is not ready yet.
 
         Args:
             implicit_wait_time (float): Time to implicitly wait for waiting_function to return True
@@ -37,11 +162,27 @@ class _BaseDriver:
         Returns:
             WebElement: Fetched WebElement (if any)
         """
-        element = WebDriverWait(
+        condition = _make_condition(waiting_function, by, selector)
+
+        # Fast path, the element is usually already in the DOM
+        start = time.monotonic()
+        try:
+            element = condition(self)
+        except (NoSuchElementException, *ignored_exceptions):
+            element = False
+        if element:
+            return element
+
+        # A missing element may have already used up time through the driver's implicit wait, only wait the rest
+        remaining_time = implicit_wait_time - (time.monotonic() - start)
+        if remaining_time <= 0:
+            raise TimeoutException(f"Waiting on element {selector} timed out after {implicit_wait_time} seconds.")
+
+        element = _AdaptiveWait(
             self,
-            implicit_wait_time,
+            remaining_time,
             ignored_exceptions=ignored_exceptions
-        ).until(waiting_function((by, selector)))
+        ).until(condition)
 
         return element
 
@@ -73,12 +214,27 @@ class _BaseDriver:
         )
         return element
 
+    def get_elements_bulk(self, selectors: list) -> dict:
+        """
+        Method fetches the elements given by multiple CSS selectors in a single script call, without waiting.
+
+        Args:
+            selectors (list): CSS selectors of elements.
+
+        Returns:
+            dict: Selector, element pairs, element is None for selectors that matched nothing
+        """
+        selectors = list(selectors)
+        elements = self.execute_script(_BULK_QUERY_SCRIPT, selectors)
+        return dict(zip(selectors, elements))
+
     def click_on_element(
         self,
         selector: str,
         by: By = By.CSS_SELECTOR,
         implicit_wait_time: float = 10,
-        ignored_exceptions: tuple = ()
+        ignored_exceptions: tuple = (),
+        fast: bool = False
     ) -> WebElement:
         """
         Method clicks on element given by it's CSS selector. Method waits an implicit_wait_time amount of seconds for
@@ -89,10 +245,21 @@ class _BaseDriver:
             by (By): Locator strategy. Defaults to By.CSS_SELECTOR.
             implicit_wait_time (float, optional): Implicit wait before an error gets thrown. Defaults to 10.
             ignored_exceptions: tuple of Selenium exceptions to ignore. Defaults to ().
+            fast (bool, optional): Try fast_click first, a JavaScript click in a single script call, see fast_click.
+                Only used with By.CSS_SELECTOR. Defaults to False.
 
         Returns:
             WebElement: Clicked element
         """
+        if fast and by == By.CSS_SELECTOR and not ignored_exceptions:
+            try:
+                element = self.fast_click(selector)
+            except JavascriptException:
+                # Invalid selector, let the native path raise the Selenium error for it
+                element = None
+            if element is not None:
+                return element
+
         element = self.get_element(
             selector,
             by=by,
@@ -102,6 +269,20 @@ class _BaseDriver:
         element.click()
         return element
 
+    def fast_click(self, selector: str) -> WebElement | None:
+        """
+        Method finds and clicks on element given by CSS selector in a single script call, without waiting.
+        Element is only clicked if it is currently visible and enabled. Like force_click_on_element this is a
+        JavaScript click, it does not scroll the element into view or check if another element would get the click.
+
+        Args:
+            selector (str): CSS selector of element to click on.
+
+        Returns:
+            WebElement | None: Clicked element, None if the element was not found or could not be clicked
+        """
+        return self.execute_script(_FAST_CLICK_SCRIPT, selector)
+
     def force_click_on_element(
         self,
         selector: str,
@@ -152,6 +333,39 @@ class _BaseDriver:
         )
         return element
 
+    def wait_on_presence_of_element_mo(self, selector: str, implicit_wait_time: float = 10) -> WebElement:
+        """
+        Method will wait until given element by CSS selector is present in the dom. Instead of polling, the wait runs
+        in the browser with a MutationObserver, so the element is returned as soon as it is added, in one script call.
+        Falls back to wait_on_presence_of_element if the script can not be run, or for the rest of the wait if the
+        driver's script timeout is shorter than implicit_wait_time.
+
+        Args:
+            selector (str): CSS selector of element.
+            implicit_wait_time (float, optional): Implicit wait before an error gets thrown. Defaults to 10.
+
+        Raises:
+            TimeoutException: Gets raised if the element is not present after implicit_wait_time seconds.
+
+        Returns:
+            WebElement: Found element
+        """
+        start = time.monotonic()
+        try:
+            element = self.execute_async_script(_PRESENCE_OBSERVER_SCRIPT, selector, implicit_wait_time)
+        except JavascriptException:
+            return self.wait_on_presence_of_element(selector, implicit_wait_time=implicit_wait_time)
+        except TimeoutException:
+            # Driver script timeout is shorter than the wait, poll for the remaining time
+            remaining_time = implicit_wait_time - (time.monotonic() - start)
+            if remaining_time > 0:
+                return self.wait_on_presence_of_element(selector, implicit_wait_time=remaining_time)
+            element = None
+
+        if element is None:
+            raise TimeoutException(f"Waiting on element {selector} timed out after {implicit_wait_time} seconds.")
+        return element
+
     def wait_on_visibility_of_element(
         self,
         selector: str,
@@ -177,13 +391,64 @@ class _BaseDriver:
         )
         return element
 
+    def __use_visible_element(
+        self,
+        use: Callable,
+        selector: str,
+        by: By,
+        implicit_wait_time: float,
+        ignored_exceptions: tuple,
+        cache: bool
+    ):
+        """
+        Method waits until element given by selector is visible and returns the result of calling use on it.
+        If cache is True, an element located less than _ELEMENT_CACHE_TTL seconds ago is reused instead of being
+        located again, stale elements are dropped from the cache and located again.
+
+        Args:
+            use (Callable): Function called with the element.
+            selector (str): Selector of element.
+            by (By): Locator strategy.
+            implicit_wait_time (float): Implicit wait before an error gets thrown.
+            ignored_exceptions (tuple): Tuple of Selenium exceptions to ignore.
+            cache (bool): If the element cache should be used.
+
+        Returns:
+            Result of use(element)
+        """
+        key = (by, selector)
+        if cache:
+            cached = self._elem_cache.get(key)
+            if cached is not None and time.monotonic() - cached[0] < _ELEMENT_CACHE_TTL:
+                try:
+                    return use(cached[1])
+                except StaleElementReferenceException:
+                    pass
+            self._elem_cache.pop(key, None)
+
+        element = self.wait_on_visibility_of_element(
+            selector=selector,
+            by=by,
+            implicit_wait_time=implicit_wait_time,
+            ignored_exceptions=ignored_exceptions
+        )
+        if cache:
+            now = time.monotonic()
+            # Drop expired entries so a long run over many selectors does not keep every element referenced
+            self._elem_cache = {
+                k: entry for k, entry in self._elem_cache.items() if now - entry[0] < _ELEMENT_CACHE_TTL
+            }
+            self._elem_cache[key] = (now, element)
+        return use(element)
+
     def extract_attribute_of_element(
         self,
         selector: str,
         attribute: str,
         by: By = By.CSS_SELECTOR,
         implicit_wait_time: float = 10,
-        ignored_exceptions: tuple = ()
+        ignored_exceptions: tuple = (),
+        cache: bool = False
     ) -> str:
         """
         Method extracts the passed attribute of element given by CSS selector.
@@ -195,41 +460,110 @@ class _BaseDriver:
             by (By): Locator strategy. Defaults to By.CSS_SELECTOR.
             implicit_wait_time (float, optional): Implicit wait before an error gets thrown. Defaults to 10.
             ignored_exceptions: tuple of Selenium exceptions to ignore. Defaults to ().
+            cache (bool, optional): Reuse the element if it was located with cache=True in the last
+                _ELEMENT_CACHE_TTL seconds. Defaults to False.
 
         Returns:
             str: Found value of element attribute
         """
-        element = self.wait_on_visibility_of_element(
-            selector=selector,
-            by=by,
-            implicit_wait_time=implicit_wait_time,
-            ignored_exceptions=ignored_exceptions
+        if by == By.CSS_SELECTOR and not ignored_exceptions and not cache:
+            # Wait on visibility and read the attribute in the browser in a single script call
+            start = time.monotonic()
+            try:
+                result = self.execute_async_script(
+                    _with_selenium_atoms(_VISIBLE_ATTRIBUTE_SCRIPT),
+                    selector,
+                    attribute,
+                    implicit_wait_time
+                )
+            except JavascriptException:
+                result = False
+            except TimeoutException:
+                # Driver script timeout is shorter than the wait, poll for the remaining time
+                remaining_time = implicit_wait_time - (time.monotonic() - start)
+                if remaining_time > 0:
+                    implicit_wait_time = remaining_time
+                    result = False
+                else:
+                    result = None
+
+            if result is None:
+                raise TimeoutException(f"Waiting on element {selector} timed out after {implicit_wait_time} seconds.")
+            if result:
+                return result["value"]
+
+        return self.__use_visible_element(
+            lambda element: element.get_attribute(attribute),
+            selector,
+            by,
+            implicit_wait_time,
+            ignored_exceptions,
+            cache
         )
-        return element.get_attribute(attribute)
 
     def get_all_element_attributes(
         self,
         selector: str,
         by: By = By.CSS_SELECTOR,
         implicit_wait_time: float = 5,
-        ignored_exceptions: tuple = ()
-    ):
+        ignored_exceptions: tuple = (),
+        cache: bool = False
+    ) -> dict:
         """
         Method extracts all possible attributes the element currently holds.
+        Attributes are read in the browser with a single script call.
 
         Args:
             selector (str): CSS selector of element to click on.
             by (By): Locator strategy. Defaults to By.CSS_SELECTOR.
             implicit_wait_time (float, optional): Implicit wait before an error gets thrown. Defaults to 10.
             ignored_exceptions: tuple of Selenium exceptions to ignore. Defaults to ().
+            cache (bool, optional): Reuse the element if it was located with cache=True in the last
+                _ELEMENT_CACHE_TTL seconds. Defaults to False.
 
         Returns:
-            str: Found value of element attribute
+            dict: Attribute name, value pairs of the element
         """
-        element = self.wait_on_visibility_of_element(
-            selector=selector,
-            by=by,
-            implicit_wait_time=implicit_wait_time,
-            ignored_exceptions=ignored_exceptions
+        return self.__use_visible_element(
+            lambda element: self.execute_script(_ALL_ATTRIBUTES_SCRIPT, element),
+            selector,
+            by,
+            implicit_wait_time,
+            ignored_exceptions,
+            cache
+        )
+
+    def get_many_attributes(
+        self,
+        selector: str,
+        attributes: list,
+        by: By = By.CSS_SELECTOR,
+        implicit_wait_time: float = 10,
+        ignored_exceptions: tuple = (),
+        cache: bool = False
+    ) -> dict:
+        """
+        Method extracts the values of the passed attributes of element given by CSS selector in a single script call,
+        instead of calling extract_attribute_of_element once per attribute.
+
+        Args:
+            selector (str): CSS selector of element.
+            attributes (list): Attribute names to extract the values of.
+            by (By): Locator strategy. Defaults to By.CSS_SELECTOR.
+            implicit_wait_time (float, optional): Implicit wait before an error gets thrown. Defaults to 10.
+            ignored_exceptions: tuple of Selenium exceptions to ignore. Defaults to ().
+            cache (bool, optional): Reuse the element if it was located with cache=True in the last
+                _ELEMENT_CACHE_TTL seconds. Defaults to False.
+
+        Returns:
+            dict: Attribute name, value pairs, values are the ones WebElement.get_attribute returns
+        """
+        script = _with_selenium_atoms(_MANY_ATTRIBUTES_SCRIPT)
+        return self.__use_visible_element(
+            lambda element: self.execute_script(script, element, list(attributes)),
+            selector,
+            by,
+            implicit_wait_time,
+            ignored_exceptions,
+            cache
         )
-        return element.get_property("attributes")
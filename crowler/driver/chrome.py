@@ -3,6 +3,12 @@ Chrome driver module.
 """
 
 from __future__ import annotations
+from concurrent.futures import Future
+import os
+import re
+import subprocess
+import threading
+from pathlib import Path
 
 from selenium.webdriver import Chrome
 from selenium.webdriver.chrome.options import Options
@@ -12,6 +18,117 @@ from selenium.webdriver.chrome.service import Service
 
 from crowler.driver._base import _BaseDriver
 
+# Directory holding the resolved chromedriver paths, one file per installed Chrome version
+_DRIVER_CACHE_DIR = Path("~/.cache/crowler/drv").expanduser()
+# Matches the version number in the output of chrome --version, e.g. "Chromium 120.0.6099.129 snap"
+_VERSION_RE = re.compile(r"\d+(?:\.\d+)+")
+# Chromedriver path resolved by the first ChromeDriver created in this process
+_CHROMEDRIVER_PATH = None
+
+
+def _build_options(
+    headless: bool,
+    window_size: tuple,
+    window_position: tuple,
+    page_load_strategy: str = "eager"
+) -> Options:
+    """
+    Function creates a Chrome Options object with the window size, window position, headless arguments and page load
+    strategy set.
+
+    Args:
+        headless (bool): If Chrome should run headless.
+        window_size (tuple): (width, height) tuple of the window size.
+        window_position (tuple): (x, y) tuple of the window position.
+        page_load_strategy (str): "normal", "eager" or "none". Defaults to "eager".
+
+    Returns:
+        Options: Chrome options with the arguments added
+    """
+    options = Options()
+    options.add_argument(f"--window-size={window_size[0]},{window_size[1]}")
+    options.add_argument(f"--window-position={window_position[0]},{window_position[1]}")
+    if headless:
+        options.add_argument("--headless=new")
+    options.page_load_strategy = page_load_strategy
+    # Remove Failed to read descriptor from node connection error
+    options.add_experimental_option('excludeSwitches', ['enable-logging'])
+    return options
+
+
+def _chrome_version() -> str | None:
+    """
+    Function returns the version string of the locally installed Chrome, or None if it could not be determined.
+    """
+    for binary in ("google-chrome", "google-chrome-stable", "chromium", "chromium-browser"):
+        try:
+            result = subprocess.run([binary, "--version"], capture_output=True, text=True, timeout=5)
+        except (OSError, subprocess.SubprocessError):
+            continue
+        if result.returncode == 0:
+            match = _VERSION_RE.search(result.stdout)
+            return match.group(0) if match else None
+    return None
+
+
+def _resolve_driver() -> str:
+    """
+    Function returns the path to the chromedriver binary. The path resolved by ChromeDriverManager is cached on disk
+    per installed Chrome version, so the version probe ChromeDriverManager().install() makes over the network is
+    only done when the cached binary is missing.
+
+    Returns:
+        str: Path to the chromedriver binary
+    """
+    version = _chrome_version()
+    cache_file = _DRIVER_CACHE_DIR / f"chromedriver-{version}" if version else None
+
+    if cache_file is not None and cache_file.is_file():
+        driver_path = cache_file.read_text().strip()
+        if os.path.isfile(driver_path) and os.access(driver_path, os.X_OK):
+            return driver_path
+
+    driver_path = ChromeDriverManager().install()
+    if cache_file is not None:
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            cache_file.write_text(driver_path)
+        except OSError:
+            pass  # Caching is best effort, the driver path is still valid
+    return driver_path
+
+
+def _prefetch_driver_path() -> None:
+    """
+    Function resolves the chromedriver path into _DRIVER_PATH_FUTURE, run in the background prefetch thread.
+    """
+    if not _DRIVER_PATH_FUTURE.set_running_or_notify_cancel():
+        return
+    try:
+        _DRIVER_PATH_FUTURE.set_result(_resolve_driver())
+    except Exception as exc:
+        _DRIVER_PATH_FUTURE.set_exception(exc)
+
+
+# Resolve the chromedriver path in the background from import time, so it is usually ready once a driver is created.
+# The thread is a daemon so scripts that never create a driver do not wait on the lookup at exit.
+_DRIVER_PATH_FUTURE = Future()
+threading.Thread(target=_prefetch_driver_path, name="crowler-chromedriver-prefetch", daemon=True).start()
+
+
+def _chromedriver_path() -> str:
+    """
+    Function returns the chromedriver path, resolving it only once per process. Waits on the background prefetch if
+    it has not finished yet and resolves the path again if the prefetch failed.
+    """
+    global _CHROMEDRIVER_PATH
+    if _CHROMEDRIVER_PATH is None:
+        try:
+            _CHROMEDRIVER_PATH = _DRIVER_PATH_FUTURE.result()
+        except Exception:
+            _CHROMEDRIVER_PATH = _resolve_driver()
+    return _CHROMEDRIVER_PATH
+
 
 class ChromeDriver(_BaseDriver, Chrome):
     """
@@ -26,6 +143,7 @@ class ChromeDriver(_BaseDriver, Chrome):
         implicit_wait: int = 10,
         window_size: tuple = (1920, 1080),
         window_position: tuple = (0, 0),
+        page_load_strategy: str = "eager",
         options: Options = None,
         **kwargs
     ) -> None:
@@ -37,55 +155,48 @@ class ChromeDriver(_BaseDriver, Chrome):
             window_size: (width, height) tuple setting the size of the opened window. Defaults to (1280,1440).
             window_position: (x, y) tuple of pixel position pair where the upper left corner of the window should
                 be positioned. Defaults to (0,0).
-            options: Custom Chrome options object can be passed, if passed the window_size, position and headless
-                mode have no effect. Defaults to None.
+            page_load_strategy: When driver.get() returns, "normal" waits for the load event, "eager" only for the
+                DOM to be ready (DOMContentLoaded), "none" returns immediately. Defaults to "eager".
+            options: Custom Chrome options object can be passed, if passed the window_size, position, headless
+                mode and page_load_strategy have no effect. Defaults to None.
             **kwargs: Get passed to the selenium.webdriver.Chrome.__init__() method.
         """
         if options:
             self.options = options
         else:
-            self.options = Options()
+            self.options = _build_options(headless, window_size, window_position, page_load_strategy)
+            self.headless = headless
             self.window_size = window_size
             self.window_position = window_position
-            self._headless = headless
-            self.headless = headless
 
-        # Remove Failed to read descriptor from node connection error   
-        self.options.add_experimental_option('excludeSwitches', ['enable-logging'])
-        
         # Initialize parent class and pass arguments
-        super().__init__(service=Service(ChromeDriverManager().install()), *args, options=self.options, **kwargs)
+        super().__init__(service=Service(_chromedriver_path()), *args, options=self.options, **kwargs)
         self.implicitly_wait(implicit_wait)
 
-    @property
-    def headless(self):
-        return self._headless
-
-    @headless.setter
-    def headless(self, is_headless: bool):
-        if is_headless:
-            self.options.add_argument("headless")
-            # Set window size to full (this might lag out headless mode otherwise)
-            self.options.add_argument("--window-size=1920,1080")
-
-    @property
-    def window_size(self):
-        return self._window_size
-
-    @window_size.setter
-    def window_size(self, size: tuple):
-        # Transform to correct string, and pass to options as argument
-        size_string = f"--window-size={size[0]},{size[1]}"
-        self.options.add_argument(size_string)
-        self._window_size = size
-
-    @property
-    def window_position(self):
-        return self._window_position
-
-    @window_position.setter
-    def window_position(self, position: tuple):
-        # Transform to correct string, and pass to options as argument
-        position_string = f"--window-position={position[0]},{position[1]}"
-        self.options.add_argument(position_string)
-        self._window_size = position
+    def get_elements_cdp(self, selector: str) -> list:
+        """
+        Method fetches all elements matching the CSS selector through the Chrome DevTools Protocol. Returns only the
+        node ids in a single message, instead of serializing every element like find_elements does.
+        Node ids stay valid until the document changes or get_elements_cdp is called again.
+
+        Args:
+            selector (str): CSS selector of elements.
+
+        Returns:
+            list: DevTools node ids of matching elements
+        """
+        root = self.execute_cdp_cmd("DOM.getDocument", {"depth": 0})["root"]
+        result = self.execute_cdp_cmd("DOM.querySelectorAll", {"nodeId": root["nodeId"], "selector": selector})
+        return result["nodeIds"]
+
+    def resolve_cdp_node(self, node_id: int) -> dict:
+        """
+        Method resolves a node id returned by get_elements_cdp to its JavaScript object.
+
+        Args:
+            node_id (int): DevTools node id.
+
+        Returns:
+            dict: DevTools RemoteObject describing the node
+        """
+        return self.execute_cdp_cmd("DOM.resolveNode", {"nodeId": node_id})["object"]
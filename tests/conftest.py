@@ -0,0 +1,4 @@
+from webdriver_manager.chrome import ChromeDriverManager
+
+# Importing crowler.driver starts resolving the chromedriver in the background, keep tests off the network
+ChromeDriverManager.install = lambda self: "/nonexistent/chromedriver"
@@ -0,0 +1,149 @@
+import time
+
+import pytest
+from selenium.common.exceptions import NoSuchElementException, StaleElementReferenceException, TimeoutException
+from selenium.webdriver.common.by import By
+
+from crowler.driver import _base
+from crowler.driver._base import _AdaptiveWait, _BaseDriver
+
+
+class FakeElement:
+    def __init__(self, name="element"):
+        self.name = name
+        self.stale = False
+
+    def is_displayed(self):
+        return True
+
+    def get_attribute(self, attribute):
+        if self.stale:
+            raise StaleElementReferenceException()
+        return f"{self.name}:{attribute}"
+
+
+class FakeDriver(_BaseDriver):
+    """
+    Driver whose element appears appear_after seconds after creation, find_element blocks for implicit_wait seconds
+    on a missing element like a browser with an implicit wait does.
+    """
+    def __init__(self, appear_after=0.0, implicit_wait=0.0):
+        super().__init__()
+        self.created = time.monotonic()
+        self.appear_after = appear_after
+        self.implicit_wait = implicit_wait
+        self.find_calls = 0
+
+    def find_element(self, by, value):
+        self.find_calls += 1
+        if self.appear_after is not None and time.monotonic() - self.created >= self.appear_after:
+            return FakeElement(value)
+        time.sleep(self.implicit_wait)
+        raise NoSuchElementException()
+
+
+@pytest.fixture
+def fake_clock(monkeypatch):
+    clock = {"now": 0.0, "sleeps": []}
+
+    def sleep(seconds):
+        clock["sleeps"].append(seconds)
+        clock["now"] += seconds
+
+    monkeypatch.setattr(_base.time, "monotonic", lambda: clock["now"])
+    monkeypatch.setattr(_base.time, "sleep", sleep)
+    return clock
+
+
+def test_adaptive_wait_backs_off_up_to_poll_frequency(fake_clock):
+    with pytest.raises(TimeoutException):
+        _AdaptiveWait(object(), 2).until(lambda driver: False)
+
+    assert fake_clock["sleeps"][:6] == pytest.approx([0.05, 0.1, 0.2, 0.4, 0.5, 0.5])
+    assert fake_clock["now"] == pytest.approx(2.25)
+
+
+def test_adaptive_wait_returns_value():
+    results = iter([False, False, "done"])
+    assert _AdaptiveWait(object(), 1).until(lambda driver: next(results)) == "done"
+
+
+def test_present_element_skips_wait():
+    driver = FakeDriver()
+    element = driver.wait_on_presence_of_element("#id")
+    assert element.name == "#id"
+    assert driver.find_calls == 1
+
+
+def test_element_appearing_later_is_found_with_backoff():
+    driver = FakeDriver(appear_after=0.2)
+    start = time.monotonic()
+    driver.wait_on_presence_of_element("#id", implicit_wait_time=2)
+    # Polls at 0.05, 0.15, 0.35 seconds, the default 0.5s polling would only find it after 0.5 seconds
+    assert time.monotonic() - start < 0.45
+
+
+def test_missing_element_times_out_after_implicit_wait_used_up_budget():
+    driver = FakeDriver(appear_after=None, implicit_wait=0.2)
+    start = time.monotonic()
+    with pytest.raises(TimeoutException):
+        driver.wait_on_presence_of_element("#id", implicit_wait_time=0.1)
+    assert time.monotonic() - start < 0.3
+    assert driver.find_calls == 1
+
+
+def test_missing_element_waits_only_remaining_time():
+    driver = FakeDriver(appear_after=None, implicit_wait=0.1)
+    start = time.monotonic()
+    with pytest.raises(TimeoutException):
+        driver.wait_on_presence_of_element("#id", implicit_wait_time=0.4)
+    assert 0.4 <= time.monotonic() - start < 0.7
+
+
+def test_zero_wait_time_raises_without_polling():
+    driver = FakeDriver(appear_after=None)
+    with pytest.raises(TimeoutException):
+        driver.wait_on_presence_of_element("#id", implicit_wait_time=0)
+    assert driver.find_calls == 1
+
+
+def test_element_cache_reuses_element_within_ttl():
+    driver = FakeDriver()
+    assert driver.extract_attribute_of_element("a", "href", by=By.ID, cache=True) == "a:href"
+    assert driver.extract_attribute_of_element("a", "title", by=By.ID, cache=True) == "a:title"
+    assert driver.find_calls == 1
+
+
+def test_element_cache_is_not_used_by_default():
+    driver = FakeDriver()
+    driver.extract_attribute_of_element("a", "href", by=By.ID)
+    driver.extract_attribute_of_element("a", "href", by=By.ID)
+    assert driver.find_calls == 2
+    assert driver._elem_cache == {}
+
+
+def test_element_cache_relocates_after_ttl(monkeypatch):
+    monkeypatch.setattr(_base, "_ELEMENT_CACHE_TTL", 0.05)
+    driver = FakeDriver()
+    driver.extract_attribute_of_element("a", "href", by=By.ID, cache=True)
+    time.sleep(0.06)
+    driver.extract_attribute_of_element("a", "href", by=By.ID, cache=True)
+    assert driver.find_calls == 2
+
+
+def test_element_cache_relocates_stale_element():
+    driver = FakeDriver()
+    driver.extract_attribute_of_element("a", "href", by=By.ID, cache=True)
+    driver._elem_cache[(By.ID, "a")][1].stale = True
+    assert driver.extract_attribute_of_element("a", "href", by=By.ID, cache=True) == "a:href"
+    assert driver.find_calls == 2
+
+
+def test_element_cache_evicts_expired_entries_on_insert(monkeypatch):
+    monkeypatch.setattr(_base, "_ELEMENT_CACHE_TTL", 0.05)
+    driver = FakeDriver()
+    for selector in ("a", "b", "c"):
+        driver.extract_attribute_of_element(selector, "href", by=By.ID, cache=True)
+    time.sleep(0.06)
+    driver.extract_attribute_of_element("d", "href", by=By.ID, cache=True)
+    assert list(driver._elem_cache) == [(By.ID, "d")]
@@ -0,0 +1,84 @@
+import os
+import subprocess
+
+import pytest
+
+from crowler.driver import chrome
+
+
+@pytest.mark.parametrize("output, version", [
+    ("Google Chrome 120.0.6099.129 \n", "120.0.6099.129"),
+    ("Chromium 120.0.6099.129 snap\n", "120.0.6099.129"),
+    ("Chromium 120.0.6099.224 built on Debian 12.4, running on Debian 12.4\n", "120.0.6099.224"),
+    ("Chromium\n", None),
+])
+def test_chrome_version(monkeypatch, output, version):
+    monkeypatch.setattr(
+        chrome.subprocess,
+        "run",
+        lambda *args, **kwargs: subprocess.CompletedProcess(args, 0, stdout=output)
+    )
+    assert chrome._chrome_version() == version
+
+
+def test_chrome_version_tries_next_binary(monkeypatch):
+    def run(command, **kwargs):
+        if command[0] != "chromium":
+            raise FileNotFoundError(command[0])
+        return subprocess.CompletedProcess(command, 0, stdout="Chromium 121.0.6167.85\n")
+
+    monkeypatch.setattr(chrome.subprocess, "run", run)
+    assert chrome._chrome_version() == "121.0.6167.85"
+
+
+def test_chrome_version_none_without_chrome(monkeypatch):
+    def run(command, **kwargs):
+        raise FileNotFoundError(command[0])
+
+    monkeypatch.setattr(chrome.subprocess, "run", run)
+    assert chrome._chrome_version() is None
+
+
+@pytest.fixture
+def driver_install(monkeypatch, tmp_path):
+    driver_binary = tmp_path / "chromedriver"
+    driver_binary.write_text("")
+    driver_binary.chmod(0o755)
+    installs = []
+
+    def install(self):
+        installs.append(self)
+        return str(driver_binary)
+
+    monkeypatch.setattr(chrome, "_DRIVER_CACHE_DIR", tmp_path / "cache")
+    monkeypatch.setattr(chrome, "_chrome_version", lambda: "120.0.6099.129")
+    monkeypatch.setattr(chrome.ChromeDriverManager, "install", install)
+    return driver_binary, installs
+
+
+def test_resolve_driver_caches_path_per_version(driver_install, tmp_path):
+    driver_binary, installs = driver_install
+
+    assert chrome._resolve_driver() == str(driver_binary)
+    assert (tmp_path / "cache" / "chromedriver-120.0.6099.129").read_text() == str(driver_binary)
+    assert chrome._resolve_driver() == str(driver_binary)
+    assert len(installs) == 1
+
+
+def test_resolve_driver_reinstalls_missing_binary(driver_install):
+    driver_binary, installs = driver_install
+
+    chrome._resolve_driver()
+    os.remove(driver_binary)
+    chrome._resolve_driver()
+    assert len(installs) == 2
+
+
+def test_resolve_driver_without_version_does_not_cache(driver_install, monkeypatch, tmp_path):
+    driver_binary, installs = driver_install
+    monkeypatch.setattr(chrome, "_chrome_version", lambda: None)
+
+    assert chrome._resolve_driver() == str(driver_binary)
+    chrome._resolve_driver()
+    assert len(installs) == 2
+    assert not (tmp_path / "cache").exists()
@@ -0,0 +1,14 @@
+import importlib
+
+import pytest
+
+
+@pytest.mark.parametrize("module", ["crowler.driver", "crowler.driver._base", "crowler.driver.chrome"])
+def test_driver_modules_import(module):
+    importlib.import_module(module)
+
+
+def test_available_browser_drivers():
+    from crowler.driver import AvailableBrowserDrivers, ChromeDriver
+
+    assert AvailableBrowserDrivers["chrome"] is ChromeDriver